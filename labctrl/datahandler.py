@@ -356,8 +356,6 @@ class DataSaver:
             if is_numeric or is_same_type:
                 return value
             else:  # else convert it to a dictionary with the index as the key
-                dic = {str(idx): item for idx, item in enumerate(value)}
-                print(f"{dic = }")
                 return {str(idx): item for idx, item in enumerate(value)}
         elif value is None:
             return h5py.Empty("S10")
@@ -1,6 +1,7 @@
 """ """
 
 import inspect
+from types import FunctionType
 from typing import Any, Type
 
 from labctrl.logger import logger
@@ -26,85 +27,153 @@ class _MISSING:
         return "<MISSING>"
 
 
-class Parameter:
+def _all(predicates, value, obj) -> bool:
+    """short-circuiting all() without the cost of creating a generator per call"""
+    for predicate in predicates:
+        if not predicate(value, obj):
+            return False
+    return True
+
+
+def _any(predicates, value, obj) -> bool:
+    """short-circuiting any() without the cost of creating a generator per call"""
+    for predicate in predicates:
+        if predicate(value, obj):
+            return True
+    return False
+
+
+def _is_builtin(spec) -> bool:
+    """True if spec is a builtin type or an instance of one, but not a function"""
+    cls = spec if isinstance(spec, type) else type(spec)
+    return cls.__module__ == "builtins" and not isinstance(spec, FunctionType)
+
+
+# key: Bounds._key() of a bound specification, value: (predicate, stringrep) tuple
+# Parameters with equal bound specifications of builtin values and types share one
+# parsed predicate, specifications with user-defined functions or classes are not cached
+_PARSED_BOUNDS = {}
+
+
+class Bounds:
     """ """
 
-    class Bounds:
+    __slots__ = ("_predicate", "_stringrep")
+
+    def __init__(self, boundspec) -> None:
         """ """
+        try:
+            key = self._key(boundspec)
+            parsed = _PARSED_BOUNDS.get(key)
+        except (TypeError, RecursionError):  # spec can't or mustn't be cached
+            key, parsed = _MISSING, None
 
-        def __init__(self, boundspec) -> None:
-            """ """
+        if parsed is None:
             try:
-                self._predicate, self._stringrep = self._parse(boundspec)
+                parsed = self._parse(boundspec)
             except (TypeError, RecursionError, ValueError, UnboundLocalError):
                 message = f"Invalid bound specification: {boundspec}"
                 logger.error(message)
                 raise BoundsParsingError(message) from None
-
-        def _parse(self, boundspec):
-            """ """
-            stringrep = str(boundspec)  # default case
-            numeric = lambda: all(isinstance(spec, (int, float)) for spec in boundspec)
-
-            # unbounded Parameter
-            if boundspec is None:
-                predicate = lambda *_: True
-            # Parameter with numeric values inside a closed interval [min, max]
-            elif isinstance(boundspec, list) and numeric() and len(boundspec) == 2:
-                min, max = boundspec
-                predicate = lambda val, _: min <= val <= max
-            # Parameter with a discrete set of values
-            elif isinstance(boundspec, set):
-                predicate = lambda val, _: val in boundspec
-            # Parameter with values of one specified type
-            elif inspect.isclass(boundspec):
-                predicate = lambda val, _: isinstance(val, boundspec)
-            # Parameter with values truth-tested by a user-defined predicate function
-            elif inspect.isfunction(boundspec):
-                num_args = len(inspect.signature(boundspec).parameters)
-                stringrep = f"tested by {boundspec.__qualname__}"
-                # function needs a single argument which is the value to be tested
-                if num_args == 1:
-                    predicate = lambda val, _: boundspec(val)
-                # function also needs the state of the object the Parameter is bound to
-                elif num_args == 2:
-                    predicate = lambda val, obj: boundspec(val, obj)
-            # Parameter with multiple bound specifications
-            else:
-                predicates, stringreps = zip(*(self._parse(spec) for spec in boundspec))
-                # value must pass all specifications
-                if isinstance(boundspec, list):
-                    predicate = lambda val, obj: all((p(val, obj) for p in predicates))
-                    stringrep = f"all({', '.join(stringreps)})"
-                # value must pass any specification
-                elif isinstance(boundspec, tuple):
-                    predicate = lambda val, obj: any((p(val, obj) for p in predicates))
-                    stringrep = f"any({', '.join(stringreps)})"
-
-            return predicate, stringrep
-
-        def __call__(self, value, obj, param) -> None:
-            """ """
-            try:
-                truth = self._predicate(value, obj)
-            except (TypeError, ValueError) as error:
-                message = f"Can't validate Parameter '{param}' bounds due to {error = }"
+            if key is not _MISSING:
+                _PARSED_BOUNDS[key] = parsed
+
+        self._predicate, self._stringrep = parsed
+
+    def _key(self, boundspec):
+        """hashable key that tells apart bound specifications that parse differently
+        raises TypeError if the specification holds user-defined functions or classes
+        as caching them would keep them and their modules alive for the whole process
+        """
+        if boundspec is None:
+            return boundspec
+        elif isinstance(boundspec, (list, tuple)):
+            return (type(boundspec), *(self._key(spec) for spec in boundspec))
+        elif isinstance(boundspec, set):
+            return (set, frozenset(self._key(spec) for spec in boundspec))
+        elif not _is_builtin(boundspec):
+            raise TypeError(f"Bound specification {boundspec} is not cached.")
+        elif isinstance(boundspec, type):
+            return boundspec
+        # key on type too, as e.g. 1 == 1.0 == True but their string reps differ
+        return (type(boundspec), boundspec)
+
+    def _parse(self, boundspec):
+        """ """
+        stringrep = str(boundspec)  # default case
+        numeric = lambda: all(isinstance(spec, (int, float)) for spec in boundspec)
+
+        # unbounded Parameter
+        if boundspec is None:
+            predicate = lambda *_: True
+        # Parameter with numeric values inside a closed interval [min, max]
+        # bind constants as default arguments, they are faster to read than closures
+        elif isinstance(boundspec, list) and numeric() and len(boundspec) == 2:
+            min, max = boundspec
+            predicate = lambda val, _, min=min, max=max: min <= val <= max
+        # Parameter with a discrete set of values, frozen against later mutation
+        elif isinstance(boundspec, set):
+            values = frozenset(boundspec)
+            predicate = lambda val, _, values=values: val in values
+        # Parameter with values of one specified type
+        elif isinstance(boundspec, type):
+            predicate = lambda val, _, cls=boundspec: isinstance(val, cls)
+        # Parameter with values truth-tested by a user-defined predicate function
+        elif isinstance(boundspec, FunctionType):
+            num_args = len(inspect.signature(boundspec).parameters)
+            stringrep = f"tested by {boundspec.__qualname__}"
+            # function needs a single argument which is the value to be tested
+            if num_args == 1:
+                predicate = lambda val, _: boundspec(val)
+            # function also needs the state of the object the Parameter is bound to
+            elif num_args == 2:
+                predicate = lambda val, obj: boundspec(val, obj)
+        # Parameter with multiple bound specifications
+        else:
+            predicates, stringreps = zip(*(self._parse(spec) for spec in boundspec))
+            # value must pass all specifications
+            if isinstance(boundspec, list):
+                predicate = lambda val, obj, ps=predicates: _all(ps, val, obj)
+                stringrep = f"all({', '.join(stringreps)})"
+            # value must pass any specification
+            elif isinstance(boundspec, tuple):
+                predicate = lambda val, obj, ps=predicates: _any(ps, val, obj)
+                stringrep = f"any({', '.join(stringreps)})"
+
+        return predicate, stringrep
+
+    def __call__(self, value, obj, param) -> None:
+        """ """
+        try:
+            truth = self._predicate(value, obj)
+        except (TypeError, ValueError) as error:
+            message = f"Can't validate Parameter '{param}' bounds due to {error = }"
+            logger.error(message)
+            raise BoundingError(message) from None
+        else:
+            if not truth:
+                message = f"Parameter '{param}' {value = } is out of bounds {self}"
                 logger.error(message)
-                raise BoundingError(message) from None
-            else:
-                if not truth:
-                    message = f"Parameter '{param}' {value = } is out of bounds {self}"
-                    logger.error(message)
-                    raise OutOfBoundsError(message)
+                raise OutOfBoundsError(message)
+
+    def __repr__(self) -> str:
+        """ """
+        return self._stringrep
+
+
+# shared by all unbounded Parameters, which skip validation by an identity check
+_UNBOUNDED = Bounds(None)
+
+
+class Parameter:
+    """ """
 
-        def __repr__(self) -> str:
-            """ """
-            return self._stringrep
+    __slots__ = ("_name", "_bound", "_default", "fget", "fset")
 
     def __init__(self, bounds=None, default=_MISSING):
         """ """
         self._name = None  # updated by __set_name__()
-        self._bound = self.Bounds(bounds)
+        self._bound = _UNBOUNDED if bounds is None else Bounds(bounds)
         self._default = default  # default value of the parameter
         # we use "public" names "fget" and "fset" to partly "duck" as a Python property
         self.fget, self.fset = None, None  # updated by getter() and setter()
@@ -132,7 +201,8 @@ class Parameter:
             raise AttributeError(message)
 
         value = self.fget(obj)
-        self._bound(value, obj, self._name)  # validate the value that was got
+        if self._bound is not _UNBOUNDED:
+            self._bound(value, obj, self._name)  # validate the value that was got
         return value
 
     def __set__(self, obj: Any, value: Any) -> Any:
@@ -141,7 +211,8 @@ class Parameter:
             message = f"Parameter '{self._name}' is not settable."
             logger.error(message)
             raise AttributeError(message)
-        self._bound(value, obj, self)  # validate the value to be set
+        if self._bound is not _UNBOUNDED:
+            self._bound(value, obj, self._name)  # validate the value to be set
         self.fset(obj, value)
 
     def getter(self, getter):
@@ -177,9 +248,13 @@ class Parameter:
 
 def parametrize(cls: Type[Any]) -> dict[str, Parameter]:
     """ """
-    if not inspect.isclass(cls):
+    if not isinstance(cls, type):
         message = f"Argument must be Python class, not '{cls}' of {type(cls)}."
         logger.error(message)
         raise ValueError(message)
-    f = inspect.getmro(cls)  # f is for family
-    return {k: v for c in f for k, v in c.__dict__.items() if isinstance(v, Parameter)}
+    parameters = {}
+    # walk the MRO base-first so that Parameters redefined by subclasses take precedence
+    for c in reversed(cls.__mro__):
+        found = ((k, v) for k, v in vars(c).items() if isinstance(v, Parameter))
+        parameters.update(found)
+    return parameters
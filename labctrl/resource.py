@@ -21,8 +21,10 @@ class ResourceMetaclass(type):
 
         cls._params = parametrize(cls)  # key: parameter name, value: Parameter object
         cls._defaults = {k: v.default for k, v in cls._params.items() if v.has_default}
-        cls._gettables = {k for k, v in cls._params.items() if v.is_gettable}
-        cls._settables = {k for k, v in cls._params.items() if v.is_settable}
+        # class-level constants, frozen as they must not change after class creation
+        cls._gettables = frozenset(k for k, v in cls._params.items() if v.is_gettable)
+        cls._settables = frozenset(k for k, v in cls._params.items() if v.is_settable)
+        cls._snapshot_names = tuple(sorted(cls._gettables))  # in dumping order
 
     def __repr__(cls) -> str:
         """ """
@@ -39,7 +41,8 @@ class Resource(metaclass=ResourceMetaclass):
         self._name = str(name)
         logger.debug(f"Initialized {self}.")
         # set parameters with default values (if present) if not supplied by the user
-        self.configure(**{**self.__class__._defaults, **parameters})
+        defaults = self._defaults
+        self.configure(**({**defaults, **parameters} if defaults else parameters))
 
     def __repr__(self) -> str:
         """ """
@@ -53,20 +56,21 @@ class Resource(metaclass=ResourceMetaclass):
     @property
     def parameters(self) -> list[str]:
         """ """
-        return [repr(parameter) for parameter in self.__class__._params.values()]
+        return [repr(parameter) for parameter in self._params.values()]
 
     def configure(self, **parameters) -> None:
         """ """
+        settables = self._settables  # hoisted out of the loop below
         for name, value in parameters.items():
-            if name in self.__class__._settables:
+            if name in settables:
                 setattr(self, name, value)
                 logger.debug(f"Set {self} '{name}' = {value}.")
             else:
                 logger.warning(f"'{name}' is not a settable parameter of {self}.")
 
     def snapshot(self) -> dict[str, Any]:
-        """ """
-        return {name: getattr(self, name) for name in sorted(self.__class__._gettables)}
+        """returns gettable parameter values keyed by name in sorted order, the order in which yamlizer dumps them"""
+        return {name: getattr(self, name) for name in self._snapshot_names}
 
 
 class Instrument(Resource):
@@ -8,6 +8,9 @@ import yaml
 
 from labctrl.logger import logger
 
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # set of all labctrl settings
 SETTINGS = {"datapath", "resourcepath"}
 
@@ -15,8 +18,13 @@ SETTINGSPATH = Path(__file__).resolve().parent / "settings.yml"
 SETTINGSPATH.touch(exist_ok=True)  # ensure an empty settings.yml always exists
 DEFAULT_SETTINGS = dict.fromkeys(SETTINGS)
 with open(SETTINGSPATH, "r+") as config:
-    if yaml.safe_load(config) is None:
-        yaml.safe_dump(DEFAULT_SETTINGS, config)  # ensure default settings always exist
+    if yaml.load(config, Loader=_LOADER) is None:
+        # ensure default settings always exist
+        yaml.dump(DEFAULT_SETTINGS, config, Dumper=_DUMPER)
+
+# key: (mtime, size) stamp of settings.yml, value: settings parsed from it
+# holds at most one entry, settings.yml is only re-parsed if its stamp changes
+_PARSED_SETTINGS: dict[tuple[int, int], dict] = {}
 
 class Settings:
     """ 
@@ -32,8 +40,14 @@ class Settings:
 
     def __init__(self) -> None:
         """ """
-        with open(SETTINGSPATH, "r") as config:
-            self._settings = yaml.safe_load(config)            
+        stat = SETTINGSPATH.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp not in _PARSED_SETTINGS:
+            with open(SETTINGSPATH, "r") as config:
+                settings = yaml.load(config, Loader=_LOADER)
+            _PARSED_SETTINGS.clear()
+            _PARSED_SETTINGS[stamp] = settings
+        self._settings = _PARSED_SETTINGS[stamp].copy()
 
         for name, value in self._settings.items():
             setattr(self, name, value)
@@ -53,20 +67,22 @@ class Settings:
     @property
     def settings(self) -> dict[str, str]:
         """ """
-        return {setting: getattr(self, setting) for setting in SETTINGS}
+        attributes = vars(self)  # settings are instance attributes, read them directly
+        return {setting: attributes[setting] for setting in SETTINGS}
 
     def save(self) -> None:
         """ """
         settings = self.settings
-        logger.debug(f"Saving labctrl settings = {self.settings}...")
+        logger.debug(f"Saving labctrl {settings = }...")
 
+        _PARSED_SETTINGS.clear()  # settings.yml is about to change, re-parse it
         with open(SETTINGSPATH, "w+") as config:
             try:
-                yaml.safe_dump(settings, config)
+                yaml.dump(settings, config, Dumper=_DUMPER)
             except yaml.YAMLError as error:
                 logger.error(
                     f"Failed to save labctrl settings due to a YAML error:\n"
                     f"Details: {error}"
                     f"Reverted to default settings. Please fix the error and try again."
                 )
-                yaml.safe_dump(DEFAULT_SETTINGS, config)
+                yaml.dump(DEFAULT_SETTINGS, config, Dumper=_DUMPER)
@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import argparse
 import importlib.util
-import inspect
 from pathlib import Path
 import pkgutil
+import sys
+from types import MappingProxyType
+from typing import Mapping
 
 import Pyro5.api as pyro
 import Pyro5.errors
@@ -25,6 +27,14 @@ _SERVERNAME = "STAGE"
 _STAGE_URI = f"PYRO:{_SERVERNAME}@localhost:{_PORT}"  # unique resource identifier (URI)
 
 
+# key: resolved resource folder path, value: (stamp, resource classes located in it)
+# stamp holds the path, modification time and size of every .py file in the folder
+_LOCATED: dict[Path, tuple[frozenset, set[Resource]]] = {}
+
+# resource classes already exposed with pyro in this process, they aren't exposed again
+_EXPOSED: set[Resource] = set()
+
+
 class StagingError(Exception):
     """ """
 
@@ -41,11 +51,11 @@ class Stage:
 
         logger.debug("Initializing a stage...")
 
-        # self._config and self._services will be updated by _setup()
+        # these dicts and list are updated by _load() and _serve()
         self._config = {}  # dict with key: configpath, value: list of Resources
-        # if local, services is a dict with key: resource name, value: Resource object
-        # if remote, it is a dict with key: resource name, value: remote resource URI
-        self._services = {}
+        self._resources = {}  # dict with key: resource name, value: Resource object
+        self._uris = {}  # if remote, dict with key: resource name, value: remote URI
+        self._instruments = []  # staged Instruments, to be disconnected on teardown
 
         self._daemon = daemon
 
@@ -98,22 +108,39 @@ class Stage:
 
             for resource_class in resource_classes:
                 yml.register(resource_class)
-                if self._daemon is not None:
+
+            if self._daemon is not None:
+                for resource_class in resource_classes - _EXPOSED:
                     pyro.expose(resource_class)
+                    _EXPOSED.add(resource_class)
                     logger.debug(f"Exposed '{resource_class}' with pyro.")
 
     def _load(self, *configpaths: Path) -> None:
         """ """
+        duplicate_names_message = (
+            f"Two or more resources in {configpaths = } share a name. "
+            f"All resources must have unique names to be staged."
+        )
+
+        # parse configs once and check names before instantiating resources from them,
+        # as instantiating instruments connects them
+        roots = [(configpath, yml.compose(configpath)) for configpath in configpaths]
+        names = [name for _, root in roots for name in yml.resource_names(root)]
+        if len(names) != len(set(names)):
+            logger.error(duplicate_names_message)
+            raise StagingError(duplicate_names_message)
+
         num_resources = 0
-        for configpath in configpaths:
-            resources = yml.load(configpath)
+        for configpath, root in roots:
+            resources = yml.load(configpath, root)
             self._config[configpath] = resources
             num_resources += len(resources)
             logger.info(f"Found {len(resources)} resource(s) in '{configpath.name}'.")
 
             for resource in resources:
                 try:
-                    resource_name = resource.name
+                    # intern names as they key services, pyro objectIds and attributes
+                    resource_name = sys.intern(resource.name)
                 except (TypeError, AttributeError):
                     message = (
                         f"A {resource = } in {configpath = } does not have a 'name'. "
@@ -122,21 +149,19 @@ class Stage:
                     logger.error(message)
                     raise StagingError(message) from None
                 else:
-                    self._services[resource.name] = resource
+                    self._resources[resource_name] = resource
+                    if isinstance(resource, Instrument):
+                        self._instruments.append(resource)
                     setattr(self, resource_name, resource)
                     logger.info(f"Set stage attribute '{resource_name}'")
 
-        if num_resources != len(self._services):
-            message = (
-                f"Two or more resources in {configpaths = } share a name. "
-                f"All resources must have unique names to be staged."
-            )
-            logger.error(message)
-            raise StagingError(message)
+        if num_resources != len(self._resources):
+            logger.error(duplicate_names_message)
+            raise StagingError(duplicate_names_message)
 
     def _serve(self) -> None:
         """ """
-        for name, resource in self._services.items():
+        for name, resource in self._resources.items():
             try:
                 uri = self._daemon.register(resource, objectId=name)
             except (TypeError, AttributeError):
@@ -146,7 +171,7 @@ class Stage:
                 logger.error(message)
                 raise StagingError(message) from None
             else:
-                self._services[name] = uri
+                self._uris[name] = uri
                 logger.info(f"Served '{resource}' remotely at '{uri}'.")
 
     def __enter__(self) -> Stage:
@@ -164,25 +189,26 @@ class Stage:
             yml.dump(configpath, *resources)
 
     @property
-    def services(self) -> dict[str, str]:
+    def services(self) -> Mapping[str, Resource | str]:
         """if remote stage, return dict with key = resource name and value = uri
-        if local stage, return dict with key = resource name and value - resource object
+        if local stage, return read-only view with key = resource name and value = resource
         """
-        return self._services.copy()
+        if self._is_local:
+            return MappingProxyType(self._resources)  # no copy, and still read-only
+        return self._uris.copy()  # remote callers need a dict that pyro can serialize
 
     def teardown(self) -> None:
         """disconnect instruments (if any) and shutdown daemon request loop if remote"""
         self.save()
 
-        for resource in self._services.values():
-            if isinstance(resource, Instrument):
-                try:
-                    resource.disconnect()
-                except ConnectionError:
-                    logger.warning(
-                        f"Can't disconnect '{resource}' due to a connection error. "
-                        f"Please check the physical connection and re-setup the stage."
-                    )
+        for instrument in self._instruments:
+            try:
+                instrument.disconnect()
+            except ConnectionError:
+                logger.warning(
+                    f"Can't disconnect '{instrument}' due to a connection error. "
+                    f"Please check the physical connection and re-setup the stage."
+                )
 
         if self._daemon is not None:
             self._daemon.shutdown()
@@ -246,17 +272,44 @@ def locate(source: Path) -> set[Resource]:
     """ "source" is a folder containing modules that contain all instantiable user-defined Resource subclasses. We find all resource classes defined in all modules in all subfolders of the source folder THAT ARE DESIGNATED PYTHON PACKAGES i.e. the folder has an __init__.py file. We return a set of resource classes.
 
     source must be Path object, strings will throw a TypeError
+
+    results are cached per source folder and reused until a .py file in it is added, removed or modified, so repeated calls don't re-execute unchanged modules
     """
+    key = source.resolve()
+    stats = ((path, path.stat()) for path in key.rglob("*.py"))
+    stamp = frozenset((path, st.st_mtime_ns, st.st_size) for path, st in stats)
+
+    cached = _LOCATED.get(key)
+    if cached is not None and cached[0] == stamp:
+        logger.debug(f"Found unchanged resource classes in '{source}', reusing them.")
+        return cached[1].copy()
+
+    resources = _locate(source)
+    _LOCATED[key] = (stamp, resources)
+    return resources.copy()
+
+
+def _locate(source: Path) -> set[Resource]:
+    """ """
     resources = set()
-    for modfinder, modname, is_pkg in pkgutil.iter_modules([source]):
-        if not is_pkg:  # we have found a module, let's find Resources defined in it
-            modspec = modfinder.find_spec(modname)
-            module = importlib.util.module_from_spec(modspec)
-            modspec.loader.exec_module(module)  # for module namespace to be populated
-            classes = inspect.getmembers(module, inspect.isclass)
-            resources |= {cls for _, cls in classes if issubclass(cls, Resource)}
-        else:  # we have found a subpackage, let's send it recursively to locate()
-            resources |= locate(source / modname)
+    folders = [source]  # walk subpackages with a stack instead of recursing into them
+    while folders:
+        folder = folders.pop()
+        for modfinder, modname, is_pkg in pkgutil.iter_modules([folder]):
+            if not is_pkg:  # we have found a module, let's find Resources defined in it
+                modspec = modfinder.find_spec(modname)
+                module = importlib.util.module_from_spec(modspec)
+                modspec.loader.exec_module(module)  # for module namespace to populate
+                # read the namespace directly, inspect.getmembers() also sorts it
+                classes = (v for v in vars(module).values() if isinstance(v, type))
+                # skip classes imported into the module, including labctrl base classes
+                resources |= {
+                    cls
+                    for cls in classes
+                    if cls.__module__ == module.__name__ and issubclass(cls, Resource)
+                }
+            else:  # we have found a subpackage, let's walk it next
+                folders.append(folder / modname)
     return resources
 
 
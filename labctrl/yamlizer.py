@@ -2,10 +2,19 @@
 loading.
 
 Resource classes can be registered with yamlizer to allow their instances to be
-loaded from (dumped to) yaml files without changing the class inheritance structure."""
+loaded from (dumped to) yaml files without changing the class inheritance structure.
 
+Loading and dumping are bound by PyYAML's per-node Python work, not by file I/O. So
+the scanner and emitter run in libyaml (CSafeLoader/CSafeDumper) when available, and
+the per-node constructor is kept lean by binding each class to it when registered.
+Configs stay in YAML as they are written and read by people, faster machine-only
+formats are deliberately not used."""
+
+from __future__ import annotations
+
+import functools
 from pathlib import Path
-from typing import Any, Type
+from typing import Type
 
 import numpy as np
 import yaml
@@ -13,6 +22,12 @@ import yaml
 from labctrl.logger import logger
 from labctrl.resource import Resource
 
+# use PyYAML's libyaml-backed loader and dumper if available, they are much faster
+try:
+    from yaml import CSafeDumper as _DUMPER, CSafeLoader as _LOADER
+except ImportError:
+    from yaml import SafeDumper as _DUMPER, SafeLoader as _LOADER
+
 
 class YamlRegistrationError(Exception):
     """Raised if the user tries to register a non-class object with yamlizer."""
@@ -22,24 +37,31 @@ class YamlizationError(Exception):
     """Raised if a resource object cannot be dumped to or loaded from a given path to a yaml config file"""
 
 
-class _YamlRegistrar:
-    """Internal class to keep track of classes registered with yamlizer in a single
-    Python process."""
-
-    def __init__(self) -> None:
-        """ """
-        self._register: dict[str, Type[Any]] = {}
+# keeps track of classes registered with yamlizer in a single Python process
+# key: yaml tag, value: registered Resource class
+_REGISTER: dict[str, Type[Resource]] = {}
 
 
-_REGISTRAR = _YamlRegistrar()
+_YAML_FLOAT_TAG = "tag:yaml.org,2002:float"
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+# based on the feeling that values > 1e3 are better read in scientific notation
+_SCI_NOT_THRESHOLD = 1e3
 
 
 def _sci_notation_representer(dumper, value) -> yaml.ScalarNode:
     """custom representer for converting floating point types to scientific notation if their absolute value is greater than an arbitrarily set threshold of 1e3"""
-    threshold = 1e3  # based on the feeling that values > 1e3 are better read in sci not
-    yaml_float_tag = "tag:yaml.org,2002:float"
-    value_in_sci_not = f"{value:E}" if abs(value) >= threshold else str(value)
-    return dumper.represent_scalar(yaml_float_tag, value_in_sci_not)
+    # two comparisons are cheaper than calling abs() on every float dumped
+    is_large = value >= _SCI_NOT_THRESHOLD or value <= -_SCI_NOT_THRESHOLD
+    value_in_sci_not = f"{value:E}" if is_large else str(value)
+    return dumper.represent_scalar(_YAML_FLOAT_TAG, value_in_sci_not)
+
+
+# customise dumper to represent float values in scientific notation
+_DUMPER.add_representer(float, _sci_notation_representer)
+# exact representers for common numpy floats skip the multi representer MRO walk
+_DUMPER.add_representer(np.float64, _sci_notation_representer)
+_DUMPER.add_representer(np.float32, _sci_notation_representer)
+_DUMPER.add_multi_representer(np.floating, _sci_notation_representer)
 
 
 def register(cls: Type[Resource]) -> None:
@@ -57,26 +79,28 @@ def register(cls: Type[Resource]) -> None:
         raise YamlRegistrationError(message)
 
     yamltag = cls.__name__
+    # a re-executed resource module yields a new class with the same tag, re-register it
+    if _REGISTER.get(yamltag) is cls:  # cls is already registered
+        return
 
-    yaml.SafeLoader.add_constructor(yamltag, _construct)
-    yaml.SafeDumper.add_representer(cls, _represent)
+    # bind cls to the constructor now so that loading needn't look it up per node
+    _LOADER.add_constructor(yamltag, functools.partial(_construct, cls=cls))
+    _DUMPER.add_representer(cls, _represent)
 
-    # customise dumper to represent float values in scientific notation
-    yaml.SafeDumper.add_representer(float, _sci_notation_representer)
-    yaml.SafeDumper.add_multi_representer(np.floating, _sci_notation_representer)
+    _REGISTER[yamltag] = cls
+    logger.debug(f"Registered '{cls}' with yamlizer.")
 
-    if yamltag not in _REGISTRAR._register:
-        _REGISTRAR._register[yamltag] = cls
-        logger.debug(f"Registered '{cls}' with yamlizer.")
 
-
-def _construct(loader: yaml.SafeLoader, node: yaml.MappingNode) -> Resource:
+def _construct(
+    loader: yaml.SafeLoader, node: yaml.MappingNode, cls: Type[Resource]
+) -> Resource:
     """Constructor for classes registered with yamlizer.
 
     Args:
         loader (yaml.SafeLoader): PyYAML's `SafeLoader`.
         node (yaml.MappingNode): Yaml map for initializing an instance of a registered
         custom class.
+        cls (Type[Resource]): Registered class that `node` is tagged with.
 
     Raises:
         YamlizationError: If an object cannot be instantiated with the loaded yaml map.
@@ -85,7 +109,6 @@ def _construct(loader: yaml.SafeLoader, node: yaml.MappingNode) -> Resource:
         Any: Initialized instance of the custom class."""
 
     yamlmap = loader.construct_mapping(node, deep=True)
-    cls = _REGISTRAR._register[node.tag]
     logger.debug(f"Loading an instance of {cls} from yaml...")
     return cls(**yamlmap)
 
@@ -102,15 +125,16 @@ def _represent(dumper: yaml.SafeDumper, resource: Resource) -> yaml.MappingNode:
     yamltag = resource.__class__.__name__
     yamlmap = resource.snapshot()
     logger.debug(f"Dumping '{resource}' to yaml...")
-    return dumper.represent_mapping(yamltag, yamlmap)
+    # snapshots are already in sorted key order, pass items so PyYAML doesn't re-sort
+    return dumper.represent_mapping(yamltag, yamlmap.items())
 
 
-def load(configpath: Path) -> list[Resource]:
-    """returns a list of resource objects by reading a YAML file e.g. Instruments"""
+def compose(configpath: Path) -> yaml.Node | None:
+    """returns the YAML node tree of a config without instantiating any resources, pass it to load() to instantiate them without parsing the config again"""
     try:
         with open(configpath, mode="r") as config:
-            logger.debug(f"Loading resources from '{configpath.stem}'...")
-            return yaml.safe_load(config)
+            text = config.read()  # parse one string, not many small read() calls
+        return yaml.compose(text, Loader=_LOADER)
     except IOError:
         message = (
             f"Unable to load resources from a file at {configpath = }. "
@@ -118,6 +142,42 @@ def load(configpath: Path) -> list[Resource]:
         )
         logger.error(message)
         raise YamlizationError(message) from None
+    except yaml.YAMLError:
+        message = (
+            f"Failed to parse labctrl resources from {configpath}. "
+            f"Config '{configpath.name}' may have invalid yaml syntax."
+        )
+        logger.error(message)
+        raise YamlizationError(message) from None
+
+
+def resource_names(root: yaml.Node | None) -> list[str]:
+    """returns the string names of resources in a composed config, names of other types are skipped"""
+    names = []
+    if not isinstance(root, yaml.SequenceNode):
+        return names
+    for resourcenode in root.value:
+        if not isinstance(resourcenode, yaml.MappingNode):
+            continue
+        for key, value in resourcenode.value:
+            if key.value == "name":
+                if isinstance(value, yaml.ScalarNode) and value.tag == _YAML_STR_TAG:
+                    names.append(value.value)
+                break
+    return names
+
+
+def load(configpath: Path, root: yaml.Node | None = None) -> list[Resource]:
+    """returns a list of resource objects by reading a YAML file e.g. Instruments
+    if root is given, resources are instantiated from this composed config instead"""
+    if root is None:
+        root = compose(configpath)
+    if root is None:  # config is empty
+        return None
+
+    try:
+        logger.debug(f"Loading resources from '{configpath.stem}'...")
+        return _LOADER("").construct_document(root)
     except AttributeError:
         message = (
             f"Failed to load a labctrl resource from {configpath}. "
@@ -137,9 +197,11 @@ def load(configpath: Path) -> list[Resource]:
 def dump(configpath: Path, *resources: Resource) -> None:
     """ """
     try:
+        logger.debug(f"Dumping resources to '{configpath.stem}'...")
+        # serialize before opening the config so a failed dump doesn't truncate it
+        text = yaml.dump(resources, Dumper=_DUMPER)
         with open(configpath, mode="w+") as config:
-            logger.debug(f"Dumping resources to '{configpath.stem}'...")
-            yaml.safe_dump(resources, config)
+            config.write(text)
     except IOError:
         message = (
             f"Unable to save resources to a file at {configpath = }. "
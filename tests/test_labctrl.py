@@ -1,5 +1,50 @@
+import pytest
+
 from labctrl import __version__
+from labctrl.parameter import OutOfBoundsError, Parameter
+from labctrl.resource import Resource
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+class Amplifier(Resource):
+    """ """
+
+    gain = Parameter(bounds=[0, 1])
+
+    @gain.getter
+    def gain(self) -> float:
+        """ """
+        return self._gain
+
+
+class TunableAmplifier(Amplifier):
+    """ """
+
+    gain = Parameter(bounds=[0, 10])
+
+    @gain.getter
+    def gain(self) -> float:
+        """ """
+        return self._gain
+
+    @gain.setter
+    def gain(self, value: float) -> None:
+        """ """
+        self._gain = value
+
+
+def test_redefined_parameter_overrides_base_parameter():
+    assert list(TunableAmplifier._params) == ["name", "gain"]
+    assert TunableAmplifier._params["gain"] is vars(TunableAmplifier)["gain"]
+    assert Amplifier._params["gain"] is vars(Amplifier)["gain"]
+
+    assert "gain" in TunableAmplifier._settables
+    assert "gain" not in Amplifier._settables
+
+    # 5 is outside the base class bounds but inside the subclass bounds
+    assert TunableAmplifier(name="amp", gain=5).gain == 5
+    with pytest.raises(OutOfBoundsError):
+        TunableAmplifier(name="amp", gain=20)